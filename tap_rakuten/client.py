@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
 
+import codecs
 import csv
-import io
+import datetime
+import logging
+import re
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+import orjson
 import pendulum
 import requests
+from singer_sdk import metrics
 from singer_sdk.authenticators import BearerTokenAuthenticator
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseAPIPaginator  # noqa: TCH002
@@ -17,14 +28,154 @@ from singer_sdk.streams import RESTStream
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+_MONEY_TBL = str.maketrans('', '', ',$')
+_HEADER_TBL = str.maketrans({' ': '_', '#': 'num'})
+_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2})')
+_LONG_DATE_FORMAT = '%m/%d/%Y'
+_CHUNK_SIZE = 1024 * 1024
+# Prefetched report bodies beyond this size spill from memory to a temp file.
+_SPOOL_SIZE = 16 * 1024 * 1024
+
+
+def _normalize_header(name: str) -> str:
+    """Convert a report column name into its record property name."""
+    return name.lower().translate(_HEADER_TBL)
+
+
+def _format_transaction_date(value: str) -> str:
+    """Convert a report date (``M/D/YY``) into ``YYYY-MM-DD HH:mm:ss``."""
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        # Off the fast path (e.g. a four-digit year); strptime raises ValueError
+        # for anything it cannot read either.
+        return datetime.datetime.strptime(value, _LONG_DATE_FORMAT).strftime('%Y-%m-%d %H:%M:%S')
+    # Building a date rejects out-of-range months and days (e.g. 2/30/26).
+    return f"{datetime.date(2000 + int(match[3]), int(match[1]), int(match[2])).isoformat()} 00:00:00"
+
+
+def _to_int(value: str) -> int:
+    """Parse a report integer, ignoring currency and thousands separators."""
+    return int(value.translate(_MONEY_TBL))
+
+
+def _to_float(value: str) -> float:
+    """Parse a report amount, ignoring currency and thousands separators."""
+    return float(value.translate(_MONEY_TBL))
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Re-split decoded text chunks into lines, without their line endings."""
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def _split_rows(lines: Iterator[str]) -> Iterator[list[str]]:
+    """Split CSV lines into fields, deferring to ``csv`` only for quoted rows.
+
+    Most report rows carry no quotes at all, and for those ``str.split`` is
+    considerably cheaper than the csv state machine.
+    """
+    quoted: list[str] = []
+
+    def quoted_lines() -> Iterator[str]:
+        # Hand csv the quoted line, then any continuation lines it asks for while
+        # inside a multi-line field; csv owns all of the quoting rules.
+        while True:
+            line = quoted.pop() if quoted else next(lines, None)
+            if line is None:
+                return
+            yield line.rstrip('\r') + '\n'
+
+    reader = csv.reader(quoted_lines())
+    for line in lines:
+        if '"' not in line:
+            line = line.rstrip('\r')
+            if line:
+                yield line.split(',')
+            continue
+        quoted.append(line)
+        yield next(reader)
+
+
+def _converter_for(prop: dict) -> Callable[[str], Any]:
+    """Pick the parser for a CSV column from its JSON schema definition.
+
+    String columns get ``str``, which hands back the value it is given.
+    """
+    types = prop.get('type', [])
+    if 'integer' in types:
+        return _to_int
+    if 'number' in types:
+        return _to_float
+    if prop.get('format') == 'date-time':
+        return _format_transaction_date
+    return str
+
+
+def _compile_row_builder(columns: list[tuple[int, str, Callable[[str], Any]]]) -> Callable[[list[str]], dict]:
+    """Generate a function that turns one row's fields into a record.
+
+    The generated body is a single dict display with every column's
+    conversion written inline, e.g. ``{'mid': int(fields[1].translate(T)), ...}``,
+    so there is no per-field loop or converter dispatch left at run time.
+
+    Args:
+        columns: ``(index, name, converter)`` for each CSV column.
+
+    Returns:
+        The compiled row builder.
+    """
+    namespace: dict[str, Any] = {'T': _MONEY_TBL}
+    items = []
+    for index, name, convert in columns:
+        field = f'fields[{index}]'
+        if convert is str:
+            expr = field
+        elif convert is _to_int:
+            expr = f'int({field}.translate(T))'
+        elif convert is _to_float:
+            expr = f'float({field}.translate(T))'
+        else:
+            namespace[f'c{index}'] = convert
+            expr = f'c{index}({field})'
+        items.append(f'{name!r}: {expr}')
+    # Bind helpers as defaults so the body only does fast local lookups.
+    params = ', '.join(['fields', *(f'{key}={key}' for key in namespace)])
+    source = f"def build_row({params}):\n    return {{{', '.join(items)}}}\n"
+    exec(source, namespace)  # noqa: S102
+    return namespace['build_row']
+
+
+def _close_prefetched(future: Future) -> None:
+    """Discard the spooled body of a prefetched window that will not be read."""
+    if not future.cancelled() and future.exception() is None:
+        future.result()[2].close()
+
+
 class DayChunkPaginator(BaseAPIPaginator):
-    """A paginator that increments days in a date range."""
+    """A paginator that walks a date range in fixed-size ``(start, end)`` windows."""
 
-    def __init__(self, start_date: str, increment: int = 1, *args: Any, **kwargs: Any) -> None:
-        super().__init__(start_date)
-        self._value = pendulum.parse(start_date)
-        self._end = pendulum.today()
+    def __init__(
+        self,
+        start_date: str,
+        increment: int = 1,
+        end_date: datetime.date | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._end = end_date or datetime.date.today()
         self._increment = increment
+        self._delta = datetime.timedelta(days=increment)
+        super().__init__(self._window(datetime.date.fromisoformat(start_date)))
+
+    def _window(self, start: datetime.date) -> tuple[datetime.date, datetime.date]:
+        """Return the window beginning at ``start``, clipped to the end date."""
+        return start, min(start + self._delta, self._end)
 
     @property
     def end_date(self):
@@ -45,7 +196,7 @@ class DayChunkPaginator(BaseAPIPaginator):
         return self._increment
 
     def get_next(self, response: requests.Response):
-        return self.current_value + pendulum.duration(days=self.increment) if self.has_more(response) else None
+        return self._window(self.current_value[1]) if self.has_more(response) else None
 
     def has_more(self, response: requests.Response) -> bool:
         """Checks if there are more days to process.
@@ -56,7 +207,7 @@ class DayChunkPaginator(BaseAPIPaginator):
         Returns:
             Boolean flag used to indicate if the endpoint has more pages.
         """
-        return self.current_value + pendulum.duration(days=self.increment) < self.end_date
+        return self.current_value[1] < self.end_date
 
 
 class RakutenStream(RESTStream):
@@ -80,15 +231,28 @@ class RakutenStream(RESTStream):
             60 days is mostly arbitrary but felt like a conservative enough return window.
         """
         start_date = (pendulum.parse(self._starting_replication_key_value) - pendulum.duration(days=60)).format('YYYY-MM-DD')
-        return DayChunkPaginator(start_date=start_date, increment=28)
+        return DayChunkPaginator(start_date=start_date, increment=28, end_date=self._today)
 
     def get_records(self, context: Optional[dict]) -> Iterable[dict[str, Any]]:
         # Adding replication key value to the stream properties since it's currently impossible to add context to the paginator object
         # https://github.com/meltano/sdk/issues/1520
         self._starting_replication_key_value = self.get_starting_replication_key_value(context)
+        # Pin "today" for the whole sync so every window agrees on where the range ends.
+        self._today = datetime.date.today()
         yield from super().get_records(context=context)
 
 
+    @cached_property
+    def _base_params(self) -> dict[str, Any]:
+        """Query parameters shared by every report request."""
+        return {
+            'include_summary': 'N',
+            'network': 1,
+            'tz': 'GMT',
+            'date_type': self.config['date_type'],
+            'token': self.config['auth_token'],
+        }
+
     def get_url_params(
         self,
         context: dict | None,  # noqa: ARG002
@@ -98,44 +262,196 @@ class RakutenStream(RESTStream):
 
         Args:
             context: The stream context.
-            next_page_token: The next page index or value.
+            next_page_token: The ``(start, end)`` date window to request.
 
         Returns:
             A dictionary of URL query parameters.
         """
-        params: dict = {
-            'include_summary': 'N',
-            'network': 1,
-            'tz': 'GMT',
-            'date_type': self.config.get('date_type'),
-            'token': self.config.get('auth_token'),
-        }
-        next_page_date = next_page_token.format('YYYY-MM-DD') if next_page_token else None
-        if next_page_date:
-            params['start_date'] = next_page_date
-            end_date = pendulum.parse(next_page_date) + pendulum.duration(days=28)
-            if end_date > pendulum.today():
-                end_date = pendulum.today()
-            params['end_date'] = end_date.format('YYYY-MM-DD')
+        params = self._base_params.copy()
+        if next_page_token:
+            start_date, end_date = next_page_token
+            params['start_date'] = start_date.isoformat()
+            params['end_date'] = end_date.isoformat()
         return params
 
 
+    def _write_record_message(self, record: dict) -> None:
+        """Write out RECORD messages, serialized with orjson.
+
+        Datetimes are passed through to ``str`` so ``time_extracted`` keeps the
+        SDK's format. Unlike the SDK, orjson writes NaN floats as ``null``.
+
+        Args:
+            record: A single stream record.
+        """
+        for record_message in self._generate_record_messages(record):
+            message = orjson.dumps(record_message.to_dict(), default=str, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            sys.stdout.write(message.decode() + "\n")
+            sys.stdout.flush()
+
+        self._is_state_flushed = False
+
+    def request_records(self, context: dict | None) -> Iterable[dict]:
+        """Request records from REST endpoint(s), returning response records.
+
+        Date windows are independent, so up to ``max_concurrent_requests`` of
+        them are downloaded ahead on a thread pool, each into a spooled temp
+        file. Bodies are then parsed here, one window at a time and in window
+        order.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            An item for every record in the response.
+        """
+        paginator = self.get_new_paginator()
+        windows = []
+        while not paginator.finished:
+            windows.append(paginator.current_value)
+            paginator.advance(None)
+        decorated_download = self.request_decorator(self._download)
+
+        def fetch(window: tuple) -> tuple[requests.PreparedRequest, requests.Response, IO[bytes]]:
+            prepared_request = self.prepare_request(context, next_page_token=window)
+            return (prepared_request, *decorated_download(prepared_request, context))
+
+        max_workers = self.config.get('max_concurrent_requests', 4)
+        remaining = iter(windows)
+        # The session property is created lazily and not thread-safe; build it
+        # before any worker asks for it.
+        self.requests_session  # noqa: B018
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending = deque(executor.submit(fetch, window) for window in islice(remaining, max_workers))
+            try:
+                while pending:
+                    prepared_request, resp, body = pending.popleft().result()
+                    window = next(remaining, None)
+                    if window is not None:
+                        pending.append(executor.submit(fetch, window))
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+                    with body:
+                        yield from self._parse_chunks(iter(partial(body.read, _CHUNK_SIZE), b''))
+            finally:
+                # If the consumer stops early, don't wait on windows it will never read.
+                for future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(_close_prefetched)
+                executor.shutdown(wait=False)
+
+    @cached_property
+    def _column_converters(self) -> dict[str, Callable[[str], Any]]:
+        """Map each schema property to the parser for its CSV column."""
+        return {name: _converter_for(prop) for name, prop in self.schema['properties'].items()}
+
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> requests.Response:
+        """Send the request without buffering the response body.
+
+        Reports can run to hundreds of MB, so the body is left on the socket
+        and read incrementally by ``parse_response``.
+
+        Args:
+            prepared_request: The prepared request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The (unread) HTTP response.
+        """
+        response = self.requests_session.send(prepared_request, timeout=self.timeout, stream=True)
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        try:
+            self.validate_response(response)
+        except Exception:
+            # Failed responses are never parsed, so hand the connection back now.
+            response.close()
+            raise
+        logging.debug("Response received successfully.")
+        return response
+
+    def _download(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> tuple[requests.Response, IO[bytes]]:
+        """Send the request and copy its decoded body into a spooled temp file.
+
+        The whole exchange runs under ``request_decorator``, so a connection
+        dropped partway through the body is retried like any other transient
+        failure, and prefetched windows never sit half-read on an idle socket.
+
+        Args:
+            prepared_request: The prepared request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The (closed) HTTP response and its body, rewound to the start.
+        """
+        response = self._request(prepared_request, context)
+        body = tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE)
+        try:
+            with response:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    body.write(chunk)
+        except BaseException:
+            body.close()
+            raise
+        body.seek(0)
+        return response, body
+
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
+        Column names are normalized and numeric/date columns are converted
+        as each CSV row is read, so records leave here in their final shape.
+
         Args:
             response: The HTTP ``requests.Response`` object.
 
         Yields:
             Each record from the source.
         """
-        reader = csv.DictReader(
-            io.TextIOWrapper(io.BytesIO(response.content), encoding='utf-8'),
-            delimiter=',',
-            quotechar='"',
-            )
-        for row in reader:
-            yield row
+        # The body is streamed, so release the connection however parsing ends.
+        with response:
+            yield from self._parse_chunks(response.iter_content(chunk_size=_CHUNK_SIZE))
+
+    def _parse_chunks(self, chunks: Iterable[bytes]) -> Iterator[dict]:
+        """Parse a report CSV, given as UTF-8 byte chunks, into records.
+
+        Args:
+            chunks: The report body.
+
+        Yields:
+            Each record from the report.
+        """
+        rows = _split_rows(_iter_lines(codecs.iterdecode(chunks, 'utf-8')))
+        header = next(rows, None)
+        if header is None:
+            return
+        header_map = {key: _normalize_header(key) for key in header}
+        # Resolve each column's position and converter once per response, then
+        # compile them into a single row builder.
+        converters = self._column_converters
+        columns = []
+        for index, key in enumerate(header):
+            name = header_map[key]
+            columns.append((index, name, converters.get(name, str)))
+        build_row = _compile_row_builder(columns)
+        for fields in rows:
+            yield build_row(fields)
 
     def post_process(
         self,
@@ -144,20 +460,14 @@ class RakutenStream(RESTStream):
     ) -> dict | None:
         """As needed, append or transform raw data to match expected structure.
 
+        Records are renamed and typed while the CSV is read in
+        ``parse_response``, so there is nothing left to do here.
+
         Args:
             row: An individual record from the stream.
             context: The stream context.
 
         Returns:
-            The updated record dictionary, or ``None`` to skip the record.
+            The record dictionary, unchanged.
         """
-        # TODO: Delete this method if not needed.
-        new_row = {}
-        for key, value in row.items():
-            new_row[key.lower().replace(' ', '_').replace('#', 'num')] = value
-        new_row['transaction_date'] = pendulum.from_format(new_row['transaction_date'], 'M/D/YY').format('YYYY-MM-DD HH:mm:ss')
-        for int_col in ['mid', 'num_of_impressions', 'num_of_clicks', 'num_of_orders']:
-            new_row[int_col] = int(new_row[int_col].replace(',', '').replace('$', ''))
-        for float_col in ['gross_sales', 'sales', 'gross_total_commissions', 'total_commission']:
-            new_row[float_col] = float(new_row[float_col].replace(',', '').replace('$', ''))
-        return new_row
+        return row
@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+import json
 import typing as t
+from functools import lru_cache
 from pathlib import Path
 
 from singer_sdk import typing as th  # JSON Schema typing helpers
 
 from tap_rakuten.client import RakutenStream
 
-SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")\
+SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
+
+
+@lru_cache(maxsize=None)
+def _load_schema(filepath: Path, raw_strings: bool = False) -> dict:
+    """Read and parse a schema file, once per process.
+
+    With ``raw_strings``, integer and number properties are retyped as strings
+    so the report values can be passed through without parsing.
+    """
+    schema = json.loads(filepath.read_text())
+    if raw_strings:
+        for prop in schema['properties'].values():
+            if 'integer' in prop['type'] or 'number' in prop['type']:
+                prop['type'] = ['null', 'string']
+    return schema
 
 
 class ReportStream(RakutenStream):
@@ -18,4 +35,12 @@ class ReportStream(RakutenStream):
     name = "Report"
     path = ""
     replication_key = 'transaction_date'
-    schema_filepath = SCHEMAS_DIR / "report.schema.json"
\ No newline at end of file
+
+    @property
+    def schema(self) -> dict:
+        """Get the report schema, shared by every ``ReportStream`` instance.
+
+        Returns:
+            JSON Schema dictionary for this stream.
+        """
+        return _load_schema(SCHEMAS_DIR / "report.schema.json", bool(self.config.get('raw_strings')))
@@ -46,6 +46,21 @@ class TapRakuten(Tap):
             th.DateTimeType,
             description="The earliest record date to sync",
         ),
+        th.Property(
+            "max_concurrent_requests",
+            # Required (but defaulted) so the SDK doesn't make it nullable: a null
+            # pool size would mean unbounded prefetching.
+            th.CustomType({"type": ["integer"], "minimum": 1}),
+            required=True,
+            default=4,
+            description="How many report date windows to download at the same time",
+        ),
+        th.Property(
+            "raw_strings",
+            th.BooleanType,
+            default=False,
+            description="Emit numeric columns as the strings found in the report instead of parsing them. Transaction dates are still normalized, since they drive replication.",
+        ),
         th.Property("stream_maps", th.ObjectType()),
         th.Property("stream_map_config", th.ObjectType())
     ).to_dict()
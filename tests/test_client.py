@@ -0,0 +1,261 @@
+"""Tests for report parsing and pagination in the Rakuten client."""
+
+from __future__ import annotations
+
+import datetime
+import http.client
+import io
+import json
+import random
+import time
+from urllib.parse import parse_qs, urlparse
+
+import backoff
+
+import pendulum
+import pytest
+import requests
+import singer_sdk._singerlib as singer
+from singer_sdk._singerlib.messages import format_message
+from singer_sdk.exceptions import ConfigValidationError, RetriableAPIError
+from singer_sdk.streams import core
+from urllib3.response import HTTPResponse
+
+from tap_rakuten import client
+from tap_rakuten.client import DayChunkPaginator
+from tap_rakuten.tap import TapRakuten
+
+SAMPLE_CONFIG = {
+    "auth_token": "token",
+    "region": "en",
+    "report_slug": "api-orders-report-v2",
+    "date_type": "transaction",
+    "start_date": "2023-07-20",
+}
+
+HEADER = (
+    "﻿Advertiser Name,MID,# of Clicks,# of Impressions,# of Orders,Gross Sales,Sales,"
+    "Gross Total Commissions,Total Commission,Member ID (U1),Product Name,Transaction Date,"
+    "Referrer URL,Order ID,Transaction ID"
+)
+PLAIN_ROW = "Acme,12345,7,10,2,$12.50,$12.00,$1.00,$0.50,u1,Widget,8/1/23,http://x.com/a,o1,t1"
+QUOTED_ROW = 'Beta Co,42,"1,234",0,1,"$1,234.50",$3.10,$0.31,$0.31,,"Thing, with comma",12/25/23,,o2,t2'
+MULTILINE_ROW = 'Gamma,7,1,1,1,$5.00,$5.00,$0.10,$0.10,u3,"two\r\nlines ""quoted""",1/2/24,,o3,t3'
+
+
+def make_response(body: bytes, url: str = "https://example.com") -> requests.Response:
+    """Build a streamed response whose body is read from ``body``."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+
+def make_body(*rows: str, newline: str = "\r\n") -> bytes:
+    return newline.join([HEADER, *rows, ""]).encode("utf-8")
+
+
+@pytest.fixture()
+def stream():
+    tap = TapRakuten(config=SAMPLE_CONFIG, parse_env_config=False)
+    return tap.streams["Report"]
+
+
+def test_parse_response_types_and_renames(stream):
+    (record,) = stream.parse_response(make_response(make_body(PLAIN_ROW)))
+    assert record == {
+        "﻿advertiser_name": "Acme",
+        "mid": 12345,
+        "num_of_clicks": 7,
+        "num_of_impressions": 10,
+        "num_of_orders": 2,
+        "gross_sales": 12.5,
+        "sales": 12.0,
+        "gross_total_commissions": 1.0,
+        "total_commission": 0.5,
+        "member_id_(u1)": "u1",
+        "product_name": "Widget",
+        "transaction_date": "2023-08-01 00:00:00",
+        "referrer_url": "http://x.com/a",
+        "order_id": "o1",
+        "transaction_id": "t1",
+    }
+
+
+def test_parse_response_quoted_fields(stream):
+    records = list(stream.parse_response(make_response(make_body(QUOTED_ROW, MULTILINE_ROW))))
+    assert records[0]["num_of_clicks"] == 1234
+    assert records[0]["gross_sales"] == 1234.5
+    assert records[0]["product_name"] == "Thing, with comma"
+    assert records[1]["product_name"] == 'two\nlines "quoted"'
+    assert records[1]["transaction_date"] == "2024-01-02 00:00:00"
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\n"])
+def test_parse_response_line_endings(stream, newline):
+    body = make_body(PLAIN_ROW, MULTILINE_ROW, newline=newline)
+    records = list(stream.parse_response(make_response(body)))
+    assert [r["order_id"] for r in records] == ["o1", "o3"]
+    assert records[1]["product_name"] == 'two\nlines "quoted"'
+
+
+def test_parse_response_stray_quote_in_unquoted_field(stream):
+    stray = PLAIN_ROW.replace("Widget", 'Monitor 27" LED').replace("o1", "o2")
+    body = make_body(PLAIN_ROW, stray, PLAIN_ROW.replace("o1", "o3"))
+    records = list(stream.parse_response(make_response(body)))
+    assert [r["order_id"] for r in records] == ["o1", "o2", "o3"]
+    assert records[1]["product_name"] == 'Monitor 27" LED'
+
+
+def test_parse_response_skips_blank_lines(stream):
+    body = make_body(PLAIN_ROW, "", QUOTED_ROW, "")
+    records = list(stream.parse_response(make_response(body)))
+    assert [r["order_id"] for r in records] == ["o1", "o2"]
+
+
+def test_parse_response_empty_body(stream):
+    assert list(stream.parse_response(make_response(b""))) == []
+
+
+def test_parse_response_multibyte_split_across_chunks(stream, monkeypatch):
+    monkeypatch.setattr(client, "_CHUNK_SIZE", 1)
+    body = make_body(PLAIN_ROW.replace("Widget", "Café €"))
+    (record,) = stream.parse_response(make_response(body))
+    assert "﻿advertiser_name" in record
+    assert record["product_name"] == "Café €"
+
+
+def test_parse_response_interleaved_generators(stream, monkeypatch):
+    body = make_body(PLAIN_ROW, "€" + PLAIN_ROW)
+    # End the first chunk one byte into the euro sign, right after the first record.
+    first_row_end = body.index(b"\n", body.index(b"\n") + 1) + 1
+    monkeypatch.setattr(client, "_CHUNK_SIZE", first_row_end + 1)
+    paused = stream.parse_response(make_response(body))
+    assert next(paused)["order_id"] == "o1"
+    assert len(list(stream.parse_response(make_response(make_body(PLAIN_ROW))))) == 1
+    (record,) = paused
+    assert record["﻿advertiser_name"] == "€Acme"
+
+
+def test_request_closes_rejected_response(stream):
+    response = make_response(b"")
+    response.status_code = 500
+    stream.requests_session.send = lambda prepared_request, **kwargs: response
+    prepared_request = requests.Request("GET", "https://example.com").prepare()
+
+    with pytest.raises(RetriableAPIError):
+        stream._request(prepared_request, None)
+    assert response.raw.closed
+
+
+def test_request_records_keeps_window_order(stream):
+    def send(prepared_request, **kwargs):
+        start_date = parse_qs(urlparse(prepared_request.url).query)["start_date"][0]
+        # Finish requests out of order.
+        time.sleep(random.random() * 0.02)
+        row = PLAIN_ROW.replace("8/1/23", f"{datetime.date.fromisoformat(start_date):%m/%d/%y}")
+        return make_response(make_body(row), url=prepared_request.url)
+
+    stream.requests_session.send = send
+    stream._starting_replication_key_value = "2026-01-01"
+    stream._today = datetime.date(2026, 6, 1)
+    dates = [record["transaction_date"] for record in stream.request_records(None)]
+    assert len(dates) == 8
+    assert dates == sorted(dates)
+    assert dates[0] == "2025-11-02 00:00:00"
+
+
+class DroppedBody(io.BytesIO):
+    """A body whose connection drops after the first read."""
+
+    def read(self, *args):
+        if self.tell():
+            raise http.client.IncompleteRead(b"")
+        return super().read(*args)
+
+
+def test_request_records_retries_dropped_body(stream, monkeypatch):
+    monkeypatch.setattr(client, "_CHUNK_SIZE", 16)
+    monkeypatch.setattr(stream, "backoff_wait_generator", lambda: backoff.constant(interval=0))
+    monkeypatch.setattr(stream, "backoff_jitter", lambda value: value)
+    attempts = []
+
+    def send(prepared_request, **kwargs):
+        attempts.append(prepared_request.url)
+        response = make_response(make_body(PLAIN_ROW), url=prepared_request.url)
+        if len(attempts) == 1:
+            response.raw = HTTPResponse(body=DroppedBody(make_body(PLAIN_ROW)), preload_content=False)
+        return response
+
+    stream.requests_session.send = send
+    stream._starting_replication_key_value = "2026-01-01"
+    stream._today = datetime.date(2026, 1, 2)
+    records = list(stream.request_records(None))
+    assert len(records) == 3
+    assert len(attempts) == 4
+    assert attempts[0] in attempts[1:]
+
+
+def test_transaction_date_formats():
+    assert client._format_transaction_date("8/1/23") == "2023-08-01 00:00:00"
+    assert client._format_transaction_date("12/31/2023") == "2023-12-31 00:00:00"
+
+
+@pytest.mark.parametrize("value", ["13/45/26", "2/30/26", "not a date"])
+def test_invalid_transaction_date_raises(value):
+    with pytest.raises(ValueError):
+        client._format_transaction_date(value)
+
+
+def test_paginator_windows():
+    paginator = DayChunkPaginator("2026-01-01", increment=28, end_date=datetime.date(2026, 3, 15))
+    windows = []
+    while not paginator.finished:
+        windows.append(paginator.current_value)
+        paginator.advance(None)
+    assert windows == [
+        (datetime.date(2026, 1, 1), datetime.date(2026, 1, 29)),
+        (datetime.date(2026, 1, 29), datetime.date(2026, 2, 26)),
+        (datetime.date(2026, 2, 26), datetime.date(2026, 3, 15)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "extracted",
+    [
+        pendulum.datetime(2026, 10, 15, 9, 51, 17, tz="UTC"),
+        datetime.datetime(2026, 10, 15, 9, 51, 17, tzinfo=datetime.timezone.utc),
+    ],
+)
+def test_record_message_matches_sdk_output(stream, capsys, monkeypatch, extracted):
+    monkeypatch.setattr(core, "utc_now", lambda: extracted)
+    (record,) = stream.parse_response(make_response(make_body(PLAIN_ROW)))
+    stream._write_record_message(record)
+
+    (line,) = capsys.readouterr().out.splitlines()
+    expected = singer.RecordMessage(stream="Report", record=record, time_extracted=extracted)
+    assert json.loads(line) == json.loads(format_message(expected))
+    assert json.loads(line)["time_extracted"] == "2026-10-15 09:51:17+00:00"
+
+
+def test_max_concurrent_requests_defaults_to_four():
+    tap = TapRakuten(config=SAMPLE_CONFIG, parse_env_config=False)
+    assert tap.config["max_concurrent_requests"] == 4
+
+
+@pytest.mark.parametrize("value", [None, 0, -1])
+def test_max_concurrent_requests_must_be_positive(value):
+    with pytest.raises(ConfigValidationError):
+        TapRakuten(config={**SAMPLE_CONFIG, "max_concurrent_requests": value}, parse_env_config=False)
+
+
+def test_raw_strings_keeps_numbers_as_text():
+    tap = TapRakuten(config={**SAMPLE_CONFIG, "raw_strings": True}, parse_env_config=False)
+    stream = tap.streams["Report"]
+    assert stream.schema["properties"]["mid"]["type"] == ["null", "string"]
+
+    (record,) = stream.parse_response(make_response(make_body(PLAIN_ROW)))
+    assert record["gross_sales"] == "$12.50"
+    assert record["mid"] == "12345"
+    assert record["transaction_date"] == "2023-08-01 00:00:00"